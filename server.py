@@ -5,11 +5,16 @@ Authenticates with Cobalt Strike API and exposes operations via MCP
 """
 
 import asyncio
-import json
+import hashlib
 import os
+import re
 import sys
-from typing import Any, Dict, Optional
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
 import httpx
+import ijson
+import orjson
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
@@ -21,179 +26,396 @@ BASE_URL = os.getenv("CS_BASE_URL", "https://10.10.10.10:50443")
 USERNAME = os.getenv("CS_USERNAME", "")
 PASSWORD = os.getenv("CS_PASSWORD", "")
 VERIFY_SSL = os.getenv("CS_VERIFY_SSL", "false").lower() == "true"
+SPEC_CACHE_DIR = os.getenv(
+    "CS_SPEC_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "cs-mcp")
+)
+MAX_CONCURRENCY = int(os.getenv("CS_MAX_CONCURRENCY", "8"))
+KEEPALIVE_EXPIRY = 60.0
 
 # Global variables
 bearer_token: Optional[str] = None
 api_client: Optional[httpx.AsyncClient] = None
-openapi_spec: Optional[Dict[str, Any]] = None
+_spec_etag: Optional[str] = None
+
+# Backpressure for outbound API calls - without it a burst of parallel
+# call_tool requests can overload the teamserver and churn the connection
+# pool. Sized to match max_keepalive_connections so no gated task then
+# blocks waiting for a pooled socket.
+_API_SEM = asyncio.Semaphore(MAX_CONCURRENCY)
+
+@dataclass(slots=True, frozen=True)
+class OpRecord:
+    """Everything the call path needs for one operation, precomputed"""
+    method: str
+    path_template: str
+    path_param_names: tuple[str, ...]
+    query_param_names: frozenset[str]
+    body_required: bool
+    dispatch_fn: Callable[..., Any]
+
+
+# Caches built once after the spec is fetched - the spec is immutable for
+# the lifetime of the server, so tools and the operation lookup table never
+# need to be rebuilt per request. The tools cache is a tuple so repeated
+# tools/list polls return the same immutable object with zero work.
+_TOOLS_CACHE: tuple[Tool, ...] = ()
+_OP_INDEX: Dict[str, OpRecord] = {}
+
+# Reusable spec components (#/components/...) captured at load time, plus a
+# memo of resolved $refs so shared parameter/requestBody definitions are
+# traversed once instead of per referencing operation
+_spec_components: Dict[str, Any] = {}
+_REF_CACHE: Dict[str, Dict[str, Any]] = {}
+
+# Interning tables for tool-schema fragments. OpenAPI specs repeat the same
+# parameter shapes across hundreds of operations (page, per_page, standard
+# error bodies); sharing one canonical dict per distinct shape cuts
+# allocations and resident-set size. Tool.inputSchema is read-only by
+# convention, so sharing references is safe.
+_PARAM_SCHEMA_INTERN: Dict[tuple, Dict[str, str]] = {}
+_INPUT_SCHEMA_INTERN: Dict[tuple, Dict[str, Any]] = {}
+
+# Single precomputed option mask for serializing tool responses
+_DUMPS_OPTIONS = orjson.OPT_INDENT_2
+
+_REQUEST_BODY_SCHEMA = {
+    "type": "object",
+    "description": "Request body (JSON)"
+}
+
+# HTTP method dispatch table - each entry takes (client, path, params, body)
+# so the call path needs no if/elif chain over the method name
+_METHOD_DISPATCH = {
+    "get": lambda c, p, q, b: c.get(p, params=q),
+    "post": lambda c, p, q, b: c.post(p, json=b, params=q),
+    "put": lambda c, p, q, b: c.put(p, json=b, params=q),
+    "delete": lambda c, p, q, b: c.delete(p, params=q),
+    "patch": lambda c, p, q, b: c.patch(p, json=b, params=q),
+}
 
 
 async def authenticate() -> str:
     """
     Authenticate with Cobalt Strike API and retrieve bearer token
-    
+
+    Reuses the persistent api_client for the login POST so the TLS session
+    carries over to all subsequent API calls, then installs the bearer
+    token on the client's default headers in place.
+
     Returns:
         str: The access token
     """
     global bearer_token
-    
+
     if not USERNAME or not PASSWORD:
         raise ValueError("CS_USERNAME and CS_PASSWORD environment variables must be set")
-    
-    login_url = f"{BASE_URL}/api/auth/login"
+
+    if not api_client:
+        raise Exception("API client not initialized")
+
     login_data = {
         "username": USERNAME,
         "password": PASSWORD
     }
-    
-    async with httpx.AsyncClient(verify=VERIFY_SSL) as client:
-        try:
-            response = await client.post(login_url, json=login_data)
-            response.raise_for_status()
-            
-            auth_response = response.json()
-            access_token = auth_response.get("access_token")
-            
-            if not access_token:
-                raise ValueError("No access_token in authentication response")
-            
-            bearer_token = access_token
-            print(f"✓ Successfully authenticated with Cobalt Strike API", file=sys.stderr)
-            return access_token
-            
-        except httpx.HTTPError as e:
-            raise Exception(f"Authentication failed: {e}")
 
+    try:
+        response = await api_client.post("/api/auth/login", json=login_data)
+        response.raise_for_status()
+
+        auth_response = response.json()
+        access_token = auth_response.get("access_token")
+
+        if not access_token:
+            raise ValueError("No access_token in authentication response")
+
+        bearer_token = access_token
+        api_client.headers["Authorization"] = f"Bearer {access_token}"
+        print(f"✓ Successfully authenticated with Cobalt Strike API", file=sys.stderr)
+        return access_token
 
-async def initialize_api_client(token: str) -> httpx.AsyncClient:
+    except httpx.HTTPError as e:
+        raise Exception(f"Authentication failed: {e}")
+
+
+async def initialize_api_client() -> httpx.AsyncClient:
     """
-    Initialize the API client with bearer token authentication
-    
-    Args:
-        token: The bearer token for authentication
-        
+    Initialize the shared API client
+
+    Created before authentication and reused for the login POST itself, so
+    the TCP/TLS (and HTTP/2) connection is established exactly once. The
+    Authorization header is added in place by authenticate().
+
     Returns:
         httpx.AsyncClient: Configured API client
     """
     global api_client
-    
+
     headers = {
-        "Authorization": f"Bearer {token}",
         "Content-Type": "application/json"
     }
-    
+
+    # Explicit pool limits keep warm TLS sockets around for the lifetime of
+    # the server; the split timeout makes pool exhaustion fail fast instead
+    # of silently serializing tool calls.
+    limits = httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=MAX_CONCURRENCY,
+        keepalive_expiry=KEEPALIVE_EXPIRY
+    )
+
     api_client = httpx.AsyncClient(
         base_url=BASE_URL,
         headers=headers,
-        verify=VERIFY_SSL,
-        timeout=30.0
+        timeout=httpx.Timeout(connect=5.0, read=30.0, write=30.0, pool=5.0),
+        transport=httpx.AsyncHTTPTransport(
+            verify=VERIFY_SSL,
+            http2=True,
+            limits=limits,
+            retries=1
+        )
     )
-    
-    print(f"✓ API client initialized with bearer token", file=sys.stderr)
+
+    print(f"✓ API client initialized", file=sys.stderr)
     return api_client
 
 
-async def fetch_openapi_spec() -> Dict[str, Any]:
+def _spec_cache_paths() -> tuple[str, str]:
     """
-    Fetch the OpenAPI specification from the API
-    
+    Return the (spec, metadata) cache file paths for the configured base URL
+    """
+    key = hashlib.sha256(BASE_URL.encode()).hexdigest()[:16]
+    return (
+        os.path.join(SPEC_CACHE_DIR, f"openapi-{key}.json"),
+        os.path.join(SPEC_CACHE_DIR, f"openapi-{key}.meta.json"),
+    )
+
+
+def _load_spec_cache_meta(meta_path: str) -> Dict[str, str]:
+    """Load cached ETag/Last-Modified validators, if any"""
+    try:
+        with open(meta_path, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_spec_cache_meta(meta_path: str, headers: httpx.Headers) -> None:
+    """Persist the spec's cache validators to disk"""
+    try:
+        meta = {}
+        if "etag" in headers:
+            meta["etag"] = headers["etag"]
+        if "last-modified" in headers:
+            meta["last-modified"] = headers["last-modified"]
+        with open(meta_path, "wb") as f:
+            f.write(orjson.dumps(meta))
+    except OSError as e:
+        print(f"! Could not write spec cache metadata: {e}", file=sys.stderr)
+
+
+async def fetch_openapi_spec() -> str:
+    """
+    Fetch the OpenAPI specification, streaming it to the on-disk cache
+
+    The body is never materialized in memory here - it is streamed straight
+    to disk (or skipped entirely on a 304) and later consumed incrementally
+    by build_operation_caches().
+
     Returns:
-        Dict: The OpenAPI specification
+        str: Path to the spec file on disk
     """
-    global openapi_spec
-    
+    global _spec_etag
+
     if not api_client:
         raise Exception("API client not initialized")
-    
+
     spec_url = "/v3/api-docs"
-    
+    spec_path, meta_path = _spec_cache_paths()
+
+    # Send conditional headers when we have a cached copy to validate
+    conditional_headers = {}
+    if os.path.exists(spec_path):
+        meta = _load_spec_cache_meta(meta_path)
+        if "etag" in meta:
+            conditional_headers["If-None-Match"] = meta["etag"]
+        if "last-modified" in meta:
+            conditional_headers["If-Modified-Since"] = meta["last-modified"]
+        _spec_etag = meta.get("etag")
+
     try:
-        response = await api_client.get(spec_url)
-        response.raise_for_status()
-        
-        openapi_spec = response.json()
-        
-        # Count available operations
-        operation_count = 0
-        if "paths" in openapi_spec:
-            for path_data in openapi_spec["paths"].values():
-                operation_count += len([k for k in path_data.keys() if k in ["get", "post", "put", "delete", "patch"]])
-        
-        print(f"✓ Loaded OpenAPI spec with {operation_count} operations", file=sys.stderr)
-        return openapi_spec
-        
+        async with api_client.stream("GET", spec_url, headers=conditional_headers) as response:
+            if response.status_code == 304:
+                print(f"✓ OpenAPI spec unchanged, using on-disk cache", file=sys.stderr)
+                return spec_path
+
+            response.raise_for_status()
+
+            # Fall back to a temp file if the cache directory is unusable
+            try:
+                os.makedirs(SPEC_CACHE_DIR, exist_ok=True)
+            except OSError as e:
+                print(f"! Could not create spec cache dir: {e}", file=sys.stderr)
+                spec_path = os.path.join(tempfile.gettempdir(), os.path.basename(spec_path))
+                meta_path = None
+
+            with open(spec_path, "wb") as f:
+                async for chunk in response.aiter_bytes():
+                    f.write(chunk)
+
+            _spec_etag = response.headers.get("etag")
+            if meta_path:
+                _save_spec_cache_meta(meta_path, response.headers)
+
+            print(f"✓ Fetched OpenAPI spec ({response.http_version})", file=sys.stderr)
+            return spec_path
+
     except httpx.HTTPError as e:
         raise Exception(f"Failed to fetch OpenAPI spec: {e}")
 
 
-def create_tools_from_openapi() -> list[Tool]:
+def _resolve_ref(ref: str) -> Dict[str, Any]:
     """
-    Create MCP tools from the OpenAPI specification
-    
-    Returns:
-        list[Tool]: List of MCP tools
+    Resolve a local $ref (e.g. #/components/parameters/page) with memoization
     """
-    if not openapi_spec or "paths" not in openapi_spec:
-        return []
-    
+    resolved = _REF_CACHE.get(ref)
+    if resolved is None:
+        node: Any = {"components": _spec_components}
+        for part in ref.lstrip("#/").split("/"):
+            node = node.get(part, {}) if isinstance(node, dict) else {}
+        resolved = _REF_CACHE[ref] = node
+    return resolved
+
+
+def _deref(obj: Dict[str, Any]) -> Dict[str, Any]:
+    """Follow a $ref if present, otherwise return the object unchanged"""
+    return _resolve_ref(obj["$ref"]) if "$ref" in obj else obj
+
+
+def _tool_from_operation(path: str, method: str, operation: Dict[str, Any],
+                         operation_id: str) -> Tool:
+    """
+    Create an MCP tool from a single OpenAPI operation
+    """
+    summary = operation.get("summary", "")
+    description = operation.get("description", summary)
+
+    # Build input schema from parameters and requestBody
+    properties = {}
+    required = []
+
+    # Add path parameters
+    if "parameters" in operation:
+        for param in operation["parameters"]:
+            param = _deref(param)
+            param_name = param.get("name")
+            param_schema = param.get("schema", {})
+            key = (param_schema.get("type", "string"), param.get("description", ""))
+            schema = _PARAM_SCHEMA_INTERN.get(key)
+            if schema is None:
+                schema = _PARAM_SCHEMA_INTERN[key] = {
+                    "type": key[0],
+                    "description": key[1]
+                }
+            properties[param_name] = schema
+            if param.get("required", False):
+                required.append(param_name)
+
+    # Add request body if present
+    if "requestBody" in operation:
+        request_body = _deref(operation["requestBody"])
+        if "content" in request_body:
+            for content_type, content_data in request_body["content"].items():
+                if "application/json" in content_type and "schema" in content_data:
+                    properties["requestBody"] = _REQUEST_BODY_SCHEMA
+                    if request_body.get("required", False):
+                        required.append("requestBody")
+
+    # Whole input schemas also repeat heavily (e.g. every parameterless
+    # operation shares one), so intern those too
+    schema_key = (
+        tuple((name, id(schema)) for name, schema in properties.items()),
+        tuple(required),
+    )
+    input_schema = _INPUT_SCHEMA_INTERN.get(schema_key)
+    if input_schema is None:
+        input_schema = {
+            "type": "object",
+            "properties": properties
+        }
+        if required:
+            input_schema["required"] = required
+        _INPUT_SCHEMA_INTERN[schema_key] = input_schema
+
+    return Tool(
+        name=operation_id,
+        description=f"{summary}\n\nPath: {method.upper()} {path}\n{description}",
+        inputSchema=input_schema
+    )
+
+
+def build_operation_caches(spec_path: str) -> None:
+    """
+    Build the tools list and operation lookup table from the spec file
+
+    Streams `paths` entries with ijson one path item at a time, building
+    the Tool and the OpRecord for each operation in a single fused pass -
+    the full spec dict is never materialized in memory.
+    """
+    global _TOOLS_CACHE, _OP_INDEX, _spec_components
+
     tools = []
-    
-    for path, path_item in openapi_spec["paths"].items():
-        for method in ["get", "post", "put", "delete", "patch"]:
-            if method not in path_item:
-                continue
-            
-            operation = path_item[method]
-            operation_id = operation.get("operationId", f"{method}_{path.replace('/', '_')}")
-            summary = operation.get("summary", "")
-            description = operation.get("description", summary)
-            
-            # Build input schema from parameters and requestBody
-            properties = {}
-            required = []
-            
-            # Add path parameters
-            if "parameters" in operation:
-                for param in operation["parameters"]:
-                    param_name = param.get("name")
-                    param_schema = param.get("schema", {})
-                    properties[param_name] = {
-                        "type": param_schema.get("type", "string"),
-                        "description": param.get("description", "")
-                    }
-                    if param.get("required", False):
-                        required.append(param_name)
-            
-            # Add request body if present
-            if "requestBody" in operation:
-                request_body = operation["requestBody"]
-                if "content" in request_body:
-                    for content_type, content_data in request_body["content"].items():
-                        if "application/json" in content_type and "schema" in content_data:
-                            properties["requestBody"] = {
-                                "type": "object",
-                                "description": "Request body (JSON)"
-                            }
-                            if request_body.get("required", False):
-                                required.append("requestBody")
-            
-            input_schema = {
-                "type": "object",
-                "properties": properties
-            }
-            
-            if required:
-                input_schema["required"] = required
-            
-            tool = Tool(
-                name=operation_id,
-                description=f"{summary}\n\nPath: {method.upper()} {path}\n{description}",
-                inputSchema=input_schema
-            )
-            
-            tools.append(tool)
-    
-    return tools
+    op_index = {}
+
+    # Capture reusable components first so $refs resolve during the paths pass
+    with open(spec_path, "rb") as f:
+        for components in ijson.items(f, "components"):
+            _spec_components = components
+            break
+
+    with open(spec_path, "rb") as f:
+        for path, path_item in ijson.kvitems(f, "paths"):
+            for method in ["get", "post", "put", "delete", "patch"]:
+                if method not in path_item:
+                    continue
+
+                operation = path_item[method]
+                operation_id = operation.get("operationId", f"{method}_{path.replace('/', '_')}")
+
+                tools.append(_tool_from_operation(path, method, operation, operation_id))
+
+                # Precompute parameter routing so the call path doesn't have
+                # to re-walk operation["parameters"] or re-discover
+                # placeholder names on every invocation
+                path_param_names = tuple(re.findall(r"\{([^}]+)\}", path))
+                query_param_names = frozenset(
+                    param.get("name")
+                    for param in map(_deref, operation.get("parameters", []))
+                    if param.get("in") == "query"
+                )
+
+                op_index[operation_id] = OpRecord(
+                    method=method,
+                    path_template=path,
+                    path_param_names=path_param_names,
+                    query_param_names=query_param_names,
+                    body_required=_deref(operation.get("requestBody", {})).get("required", False),
+                    dispatch_fn=_METHOD_DISPATCH[method],
+                )
+
+    _TOOLS_CACHE = tuple(tools)
+    _OP_INDEX = op_index
+
+    # The caches fully replace the spec data: drop the components tree and
+    # build-time lookup tables so only the tools, the operation index and
+    # the ETag survive startup. The interned schema dicts stay alive through
+    # the tools that reference them.
+    _spec_components = {}
+    _REF_CACHE.clear()
+    _PARAM_SCHEMA_INTERN.clear()
+    _INPUT_SCHEMA_INTERN.clear()
+
+    print(f"✓ Loaded OpenAPI spec with {len(op_index)} operations", file=sys.stderr)
 
 
 async def call_api_operation(operation_id: str, arguments: Dict[str, Any]) -> Any:
@@ -207,63 +429,68 @@ async def call_api_operation(operation_id: str, arguments: Dict[str, Any]) -> An
     Returns:
         The API response
     """
-    if not api_client or not openapi_spec:
+    if not api_client or not _OP_INDEX:
         raise Exception("API client or OpenAPI spec not initialized")
-    
-    # Find the operation in the spec
-    for path, path_item in openapi_spec["paths"].items():
-        for method in ["get", "post", "put", "delete", "patch"]:
-            if method not in path_item:
-                continue
-            
-            operation = path_item[method]
-            if operation.get("operationId") == operation_id:
-                # Build the actual path with path parameters
-                actual_path = path
-                request_params = {}
-                request_body = None
-                
-                # Extract path parameters
-                if "parameters" in operation:
-                    for param in operation["parameters"]:
-                        param_name = param.get("name")
-                        param_in = param.get("in")
-                        
-                        if param_name in arguments:
-                            if param_in == "path":
-                                actual_path = actual_path.replace(f"{{{param_name}}}", str(arguments[param_name]))
-                            elif param_in == "query":
-                                request_params[param_name] = arguments[param_name]
-                
-                # Extract request body
-                if "requestBody" in arguments:
-                    request_body = arguments["requestBody"]
-                
-                # Make the API call
-                try:
-                    if method == "get":
-                        response = await api_client.get(actual_path, params=request_params)
-                    elif method == "post":
-                        response = await api_client.post(actual_path, json=request_body, params=request_params)
-                    elif method == "put":
-                        response = await api_client.put(actual_path, json=request_body, params=request_params)
-                    elif method == "delete":
-                        response = await api_client.delete(actual_path, params=request_params)
-                    elif method == "patch":
-                        response = await api_client.patch(actual_path, json=request_body, params=request_params)
-                    
-                    response.raise_for_status()
-                    
-                    # Try to parse as JSON, otherwise return text
-                    try:
-                        return response.json()
-                    except:
-                        return response.text
-                        
-                except httpx.HTTPError as e:
-                    raise Exception(f"API call failed: {e}")
-    
-    raise Exception(f"Operation {operation_id} not found in OpenAPI spec")
+
+    # O(1) lookup instead of rescanning the spec
+    if operation_id not in _OP_INDEX:
+        raise Exception(f"Operation {operation_id} not found in OpenAPI spec")
+
+    op = _OP_INDEX[operation_id]
+
+    # Common case first: no path parameters means no substitution pass, and
+    # no query parameters means no params dict for httpx to iterate
+    if op.path_param_names:
+        actual_path = op.path_template.format_map(
+            {name: arguments.get(name, "") for name in op.path_param_names}
+        )
+    else:
+        actual_path = op.path_template
+
+    if op.query_param_names:
+        request_params = {
+            name: arguments[name] for name in op.query_param_names if name in arguments
+        }
+    else:
+        request_params = None
+
+    request_body = arguments.get("requestBody")
+
+    # Make the API call (semaphore-gated to avoid overloading the teamserver).
+    # httpx errors propagate with their type intact; call_tool formats them.
+    async with _API_SEM:
+        response = await op.dispatch_fn(api_client, actual_path, request_params, request_body)
+
+    if response.is_error:
+        response.raise_for_status()
+
+    # Content type is the authoritative JSON-vs-text signal - no
+    # exception-driven parse attempt on the success path. Substring match
+    # also covers suffix types like application/problem+json.
+    if "json" in response.headers.get("content-type", ""):
+        return orjson.loads(response.content)
+    return response.text
+
+
+async def _keep_connection_warm() -> None:
+    """
+    Periodically ping the API so the pooled connection never idles out
+
+    A conditional GET against the spec endpoint comes back 304 with no
+    body, so the first tool call after a quiet period reuses the warm
+    TLS/HTTP2 connection instead of paying a fresh handshake.
+    """
+    interval = KEEPALIVE_EXPIRY - 5.0
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            if _spec_etag:
+                await api_client.get("/v3/api-docs", headers={"If-None-Match": _spec_etag})
+            else:
+                await api_client.head("/v3/api-docs")
+        except httpx.HTTPError:
+            # Best effort - the next tool call reconnects if needed
+            pass
 
 
 async def main():
@@ -271,34 +498,38 @@ async def main():
     
     print("Starting Cobalt Strike MCP Server...", file=sys.stderr)
     
-    # Step 1: Authenticate and get bearer token
+    # Step 1: Initialize the shared API client (one TLS handshake for the
+    # login POST and everything after it)
     try:
-        token = await authenticate()
+        await initialize_api_client()
     except Exception as e:
-        print(f"✗ Authentication failed: {e}", file=sys.stderr)
+        print(f"✗ Failed to initialize API client: {e}", file=sys.stderr)
         sys.exit(1)
-    
-    # Step 2: Initialize API client with bearer token
+
+    # Step 2: Authenticate and install the bearer token on the client
     try:
-        await initialize_api_client(token)
+        await authenticate()
     except Exception as e:
-        print(f"✗ Failed to initialize API client: {e}", file=sys.stderr)
+        print(f"✗ Authentication failed: {e}", file=sys.stderr)
         sys.exit(1)
-    
-    # Step 3: Fetch OpenAPI specification
+
+    # Step 3: Fetch OpenAPI specification (streamed to disk)
     try:
-        await fetch_openapi_spec()
+        spec_path = await fetch_openapi_spec()
     except Exception as e:
         print(f"✗ Failed to fetch OpenAPI spec: {e}", file=sys.stderr)
         sys.exit(1)
-    
-    # Step 4: Create MCP server
+
+    # Step 4: Build tool and operation caches in one pass over the spec file
+    build_operation_caches(spec_path)
+
+    # Step 5: Create MCP server
     server = Server("cobalt-strike-mcp")
     
     @server.list_tools()
-    async def list_tools() -> list[Tool]:
+    async def list_tools() -> tuple[Tool, ...]:
         """List all available tools from the OpenAPI spec"""
-        return create_tools_from_openapi()
+        return _TOOLS_CACHE
     
     @server.call_tool()
     async def call_tool(name: str, arguments: Any) -> list[TextContent]:
@@ -309,7 +540,7 @@ async def main():
             return [
                 TextContent(
                     type="text",
-                    text=json.dumps(result, indent=2) if isinstance(result, (dict, list)) else str(result)
+                    text=orjson.dumps(result, option=_DUMPS_OPTIONS, default=str).decode()
                 )
             ]
         except Exception as e:
@@ -320,18 +551,30 @@ async def main():
                 )
             ]
     
-    # Run the server
+    # Run the server, keeping the API connection warm in the background
     print("✓ MCP Server ready", file=sys.stderr)
-    
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options()
-        )
+
+    warm_task = asyncio.create_task(_keep_connection_warm())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options()
+            )
+    finally:
+        warm_task.cancel()
 
 
 
 
 if __name__ == "__main__":
+    # uvloop roughly halves per-operation event-loop overhead for this
+    # all-I/O workload; fall back to the default loop where unavailable
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
\ No newline at end of file